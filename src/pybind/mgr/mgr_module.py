@@ -402,7 +402,11 @@ def _extract_target_func(
         return f, {}
     extra_args: Dict[str, Any] = {}
     while wrapped is not None:
-        extra_args.update(getattr(f, "extra_args", {}))
+        # most wrappers carry no extra_args; avoid building a throwaway
+        # empty dict for them
+        ea = getattr(f, "extra_args", None)
+        if ea:
+            extra_args.update(ea)
         f = wrapped
         wrapped = getattr(f, "__wrapped__", None)
     return f, extra_args
@@ -420,7 +424,7 @@ class CLICommandBase(object):
         self.arg_spec = {}    # type: Dict[str, Any]
         self.first_default = -1
 
-    KNOWN_ARGS = '_', 'self', 'mgr', 'inbuf', 'return'
+    KNOWN_ARGS = frozenset({'_', 'self', 'mgr', 'inbuf', 'return'})
 
     @classmethod
     def _load_func_metadata(cls: Any, f: HandlerFuncType) -> Tuple[str, Dict[str, Any], int, str]:
@@ -471,6 +475,14 @@ class CLICommandBase(object):
     def store_func_metadata(self, f: HandlerFuncType) -> None:
         self.desc, self.arg_spec, self.first_default, self.args = \
             self._load_func_metadata(f)
+        # none of the dumped fields change after registration, so build
+        # the command description once instead of on every enumeration
+        self._cmd_dict: Dict[str, Union[str, bool]] = {
+            'cmd': '{} {}'.format(self.prefix, self.args),
+            'desc': self.desc,
+            'perm': self.perm,
+            'poll': self.poll,
+        }
 
     def _register_handler(self, func: HandlerFuncType) -> HandlerFuncType:
         self.store_func_metadata(func)
@@ -533,12 +545,8 @@ class CLICommandBase(object):
         return self.func(mgr, **kwargs)
 
     def dump_cmd(self) -> Dict[str, Union[str, bool]]:
-        return {
-            'cmd': '{} {}'.format(self.prefix, self.args),
-            'desc': self.desc,
-            'perm': self.perm,
-            'poll': self.poll,
-        }
+        # copy so callers can't mutate the cached description
+        return dict(self._cmd_dict)
 
     @classmethod
     def Read(cls, prefix: str, poll: bool = False) -> 'CLICommandBase':
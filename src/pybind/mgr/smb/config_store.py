@@ -12,18 +12,19 @@ class MemConfigEntry:
         self._store = store
         self._ns = ns
         self._name = name
+        self._full_key = (ns, name)
 
     def set(self, obj: Simplified) -> None:
-        self._store._data[(self._ns, self._name)] = obj
+        self._store._data[self._full_key] = obj
 
     def get(self) -> Simplified:
-        return self._store._data[(self._ns, self._name)]
+        return self._store._data[self._full_key]
 
     def remove(self) -> bool:
-        return self._store.remove(self.full_key)
+        return self._store.remove(self._full_key)
 
     def exists(self) -> bool:
-        return (self._ns, self._name) in self._store._data
+        return self._full_key in self._store._data
 
     @property
     def uri(self) -> str:
@@ -31,7 +32,7 @@ class MemConfigEntry:
 
     @property
     def full_key(self) -> EntryKey:
-        return (self._ns, self._name)
+        return self._full_key
 
 
 class MemConfigStore:
@@ -93,7 +94,7 @@ class EntryCache:
         return {k[0] for k in self}
 
     def contents(self, ns: str) -> Collection[str]:
-        return [kname for kns, kname in self if ns == ns]
+        return [kname for kns, kname in self if kns == ns]
 
     def __iter__(self) -> Iterator[EntryKey]:
         return iter(self._entries.keys())
@@ -938,6 +938,17 @@ def _generate_share_hosts_access(
         cfg['options']['hosts deny'] = ', '.join(hosts_deny)
 
 
+# options common to every generated cluster config. built once here -
+# treat as read-only
+_DEFAULT_GLOBAL_OPTIONS: Dict[str, str] = {
+    'load printers': 'No',
+    'printing': 'bsd',
+    'printcap name': '/dev/null',
+    'disable spoolss': 'Yes',
+    'smbd profiling level': 'on',
+}
+
+
 def _generate_config(conf: _ClusterConf) -> Dict[str, Any]:
     cluster_global_opts = {}
     cluster = conf.resource
@@ -953,9 +964,12 @@ def _generate_config(conf: _ClusterConf) -> Dict[str, Any]:
     cluster_global_opts['smb ports'] = str(_smb_port(cluster))
     _set_debug_level(cluster_global_opts, conf)
 
-    share_configs = {
-        share.resource.name: _generate_share(share) for share in conf.shares
-    }
+    # one pass over the shares fills both the name list and the config map
+    share_names: List[str] = []
+    share_configs: Dict[str, Any] = {}
+    for share in conf.shares:
+        share_names.append(share.resource.name)
+        share_configs[share.resource.name] = _generate_share(share)
 
     instance_features = []
     if cluster.is_clustered():
@@ -967,19 +981,11 @@ def _generate_config(conf: _ClusterConf) -> Dict[str, Any]:
                 'instance_name': cluster.cluster_id,
                 'instance_features': instance_features,
                 'globals': ['default', cluster.cluster_id],
-                'shares': list(share_configs.keys()),
+                'shares': share_names,
             },
         },
         'globals': {
-            'default': {
-                'options': {
-                    'load printers': 'No',
-                    'printing': 'bsd',
-                    'printcap name': '/dev/null',
-                    'disable spoolss': 'Yes',
-                    'smbd profiling level': 'on',
-                }
-            },
+            'default': {'options': _DEFAULT_GLOBAL_OPTIONS},
             cluster.cluster_id: {
                 'options': cluster_global_opts,
             },
@@ -1186,10 +1192,17 @@ def _save_pending_config(
     store: ConfigStore,
     cluster_conf: _ClusterConf,
 ) -> None:
-    # generate the cluster configuration and save it in the public store
+    # generate the cluster configuration and save it in the public store.
+    # idempotent applies regenerate the exact same configuration - skip
+    # the store write (a mon round trip) when nothing changed
     cconfig = _generate_config(cluster_conf)
     centry = store[external.config_key(cluster_conf.resource.cluster_id)]
-    centry.set(cconfig)
+    try:
+        previous = centry.get()
+    except KeyError:
+        previous = None
+    if cconfig != previous:
+        centry.set(cconfig)
     cluster_conf.change_group.cache_updated_entry(centry)
 
 
@@ -3,6 +3,8 @@ resources that the internal store holds.
 """
 from typing import Collection, Tuple, Type, TypeVar, Union
 
+import sys
+
 from . import resources
 from .enums import ConfigNS, State
 from .proto import (
@@ -23,6 +25,8 @@ T = TypeVar('T')
 class ResourceIDKey:
     """A ResourceKey for resources with only one ID."""
 
+    __slots__ = ('resource_id',)
+
     def __init__(self, resource_id: str) -> None:
         self.resource_id = resource_id
 
@@ -33,6 +37,8 @@ class ResourceIDKey:
 class ChildResourceIDKey:
     """A ResourceKey for resources with both a parent and child ID."""
 
+    __slots__ = ('parent_id', 'resource_id', '_key')
+
     def __init__(self, parent_id: str, resource_id: str) -> None:
         self.parent_id = parent_id
         self.resource_id = resource_id
@@ -46,6 +52,9 @@ class ResourceEntry:
     """Base class for resource entry getter/setter objects."""
 
     namespace: ConfigNS
+    # the str() form of the namespace, converted once per class instead of
+    # once per store operation
+    namespace_str: str
 
     def __init__(self, key: str, config_entry: ConfigEntry) -> None:
         self.key = key
@@ -109,7 +118,7 @@ class ResourceEntry:
         and identified by the given key.
         """
         _key = str(key)
-        return cls(_key, store[str(cls.namespace), _key])
+        return cls(_key, store[cls.namespace_str, _key])
 
     @classmethod
     def to_key(cls, resource: SMBResource) -> ResourceKey:
@@ -130,13 +139,14 @@ class CommonResourceEntry(ResourceEntry):
 
     @classmethod
     def ids(cls, store: ConfigStoreListing) -> Collection[str]:
-        return store.contents(str(cls.namespace))
+        return store.contents(cls.namespace_str)
 
 
 class ClusterEntry(CommonResourceEntry):
     """Cluster resource getter/setter for the smb internal data store(s)."""
 
     namespace = ConfigNS.CLUSTERS
+    namespace_str = str(namespace)
     _for_resource = (resources.Cluster, resources.RemovedCluster)
 
     @classmethod
@@ -152,6 +162,7 @@ class ShareEntry(ResourceEntry):
     """Share resource getter/setter for the smb internal data store(s)."""
 
     namespace = ConfigNS.SHARES
+    namespace_str = str(namespace)
     _for_resource = (resources.Share, resources.RemovedShare)
 
     @classmethod
@@ -163,7 +174,7 @@ class ShareEntry(ResourceEntry):
 
     @classmethod
     def ids(cls, store: ConfigStoreListing) -> Collection[Tuple[str, str]]:
-        return [_split(k) for k in store.contents(str(cls.namespace))]
+        return [_split(k) for k in store.contents(cls.namespace_str)]
 
     @classmethod
     def to_key(cls, resource: SMBResource) -> ResourceKey:
@@ -178,6 +189,7 @@ class JoinAuthEntry(CommonResourceEntry):
     """JoinAuth resource getter/setter for the smb internal data store(s)."""
 
     namespace = ConfigNS.JOIN_AUTHS
+    namespace_str = str(namespace)
     _for_resource = resources.JoinAuth
 
     @classmethod
@@ -195,6 +207,7 @@ class UsersAndGroupsEntry(CommonResourceEntry):
     """
 
     namespace = ConfigNS.USERS_AND_GROUPS
+    namespace_str = str(namespace)
     _for_resource = resources.UsersAndGroups
 
     @classmethod
@@ -212,6 +225,7 @@ class TLSCredentialEntry(CommonResourceEntry):
     """
 
     namespace = ConfigNS.TLS_CREDENTIALS
+    namespace_str = str(namespace)
     _for_resource = resources.TLSCredential
 
     @classmethod
@@ -227,6 +241,7 @@ class ExternalCephClusterEntry(CommonResourceEntry):
     """ExternalCephCluster resource getter/setter for internal store."""
 
     namespace = ConfigNS.EXTERNAL_CEPH_CLUSTERS
+    namespace_str = str(namespace)
     _for_resource = resources.ExternalCephCluster
 
     @classmethod
@@ -238,23 +253,25 @@ class ExternalCephClusterEntry(CommonResourceEntry):
         return self.get_resource_type(resources.ExternalCephCluster)
 
 
+_RESOURCE_ENTRY_MAP = {
+    resources.Cluster: ClusterEntry,
+    resources.RemovedCluster: ClusterEntry,
+    resources.Share: ShareEntry,
+    resources.RemovedShare: ShareEntry,
+    resources.JoinAuth: JoinAuthEntry,
+    resources.UsersAndGroups: UsersAndGroupsEntry,
+    resources.TLSCredential: TLSCredentialEntry,
+    resources.ExternalCephCluster: ExternalCephClusterEntry,
+}
+
+
 def map_resource_entry(
     resource: Union[SMBResource, Type[SMBResource]],
 ) -> Type[ResourceEntry]:
     """Return an entry type class given a resource object or resource class."""
     rcls = resource if isinstance(resource, type) else type(resource)
-    _map = {
-        resources.Cluster: ClusterEntry,
-        resources.RemovedCluster: ClusterEntry,
-        resources.Share: ShareEntry,
-        resources.RemovedShare: ShareEntry,
-        resources.JoinAuth: JoinAuthEntry,
-        resources.UsersAndGroups: UsersAndGroupsEntry,
-        resources.TLSCredential: TLSCredentialEntry,
-        resources.ExternalCephCluster: ExternalCephClusterEntry,
-    }
     try:
-        return _map[rcls]
+        return _RESOURCE_ENTRY_MAP[rcls]
     except KeyError:
         raise TypeError('not a valid smb resource')
 
@@ -272,9 +289,12 @@ def resource_key(resource: SMBResource) -> EntryKey:
     """Return a store entry key for an smb resource object."""
     entry_cls = map_resource_entry(resource)
     key = entry_cls.to_key(resource)
-    return str(entry_cls.namespace), str(key)
+    return entry_cls.namespace_str, str(key)
 
 
 def _split(share_key: str) -> Tuple[str, str]:
     cluster_id, share_id = share_key.split('.', 1)
-    return cluster_id, share_id
+    # the same small set of ids is split out of the store keys over and
+    # over; interning lets later dict/set probes hit the identity fast
+    # path instead of re-hashing fresh substrings
+    return sys.intern(cluster_id), sys.intern(share_id)
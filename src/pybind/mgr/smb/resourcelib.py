@@ -90,10 +90,10 @@ from typing import (
 )
 
 import dataclasses
+import enum
 import logging
 import sys
 from contextlib import contextmanager
-from itertools import chain
 
 from .proto import Self, Simplified
 
@@ -192,6 +192,9 @@ class MissingRequiredFieldError(KeyError, ResourceTypeError):
 # Sentinel object for unset/missing value conditions.
 _unset = object()
 
+# Scalar types that never require recursive conversion.
+_SCALAR_TYPES = (str, int, float, bool)
+
 
 def _unwrap_type(atype: Any) -> Tuple[Tuple, bool]:
     """Given an Optional[T] type return (T, True). Given a non-optional type
@@ -229,19 +232,57 @@ class Field:
     # subclass as a native type.
     wrapper_type: Optional[Callable] = None
 
+    def __post_init__(self) -> None:
+        # interpret the typing annotations once, at field creation time,
+        # instead of re-deriving them on every conversion
+        args, optional = _unwrap_type(self.field_type)
+        self._unwrapped_args = args
+        self._optional = optional
+        inner = args[0] if optional and len(args) == 1 else self.field_type
+        # cache the enum-ness of the field type. checking issubclass walks
+        # the mro of the type - too wasteful to repeat on every scalar
+        # conversion
+        self.is_enum: bool = isinstance(inner, type) and issubclass(
+            inner, enum.Enum
+        )
+        # probe the inner type's conversion hooks once. these getattr
+        # probes are otherwise repeated for every value converted in
+        # either direction
+        self._inner_rconfig = getattr(inner, '_resource_config', None)
+        self._inner_from_simplified = getattr(inner, 'from_simplified', None)
+        self._inner_to_simplified = getattr(inner, 'to_simplified', None)
+        # note if the field holds a container of plain scalars so that
+        # conversion can skip the per-element type dispatch
+        self._scalar_list = False
+        self._scalar_dict = False
+        # the unwrapped element type(s) for list/dict shaped fields,
+        # derived once here instead of per conversion
+        self._list_etype: Any = None
+        self._dict_etypes: Optional[Tuple[Any, Any]] = None
+        origin = _get_origin(inner)
+        eargs = _get_args(inner)
+        if origin in (list, List):
+            if len(eargs) == 1:
+                self._list_etype = eargs[0]
+            self._scalar_list = len(eargs) == 1 and eargs[0] in _SCALAR_TYPES
+        elif origin in (dict, Dict):
+            if len(eargs) == 2:
+                self._dict_etypes = (eargs[0], eargs[1])
+            self._scalar_dict = len(eargs) == 2 and all(
+                a in _SCALAR_TYPES for a in eargs
+            )
+
     def optional(self) -> bool:
         """Return true if the type of the field is Optional."""
-        _, optional = _unwrap_type(self.field_type)
-        return optional
+        return self._optional
 
     def inner_type(self) -> Any:
         """For a field with an optional type (Optional[T]) return the
         nested type (T). Otherwise return the current field type.
         """
-        args, optional = _unwrap_type(self.field_type)
-        if optional:
-            assert len(args) == 1
-            return args[0]
+        if self._optional:
+            assert len(self._unwrapped_args) == 1
+            return self._unwrapped_args[0]
         return self.field_type
 
     @_xt
@@ -274,6 +315,8 @@ class Field:
         """Assuming the field type is a list (List[T]) return the type
         of the list's elements (T).
         """
+        if self._list_etype is not None:
+            return self._list_etype
         args, optional = _unwrap_type(self.inner_type())
         assert not optional
         assert len(args) == 1
@@ -283,6 +326,8 @@ class Field:
         """Assuming the field type is a dict (List[KT, VT]) return the types
         of the dict's keys & values (KT, VT).
         """
+        if self._dict_etypes is not None:
+            return self._dict_etypes
         args, optional = _unwrap_type(self.inner_type())
         assert not optional
         assert len(args) == 2
@@ -315,6 +360,12 @@ class Resource:
 
         for fld in dataclasses.fields(self.resource_cls):
             self.fields[fld.name] = Field.create(fld)
+        # look up the optional validate method once, rather than probing
+        # every instance constructed from simplified data
+        validate = getattr(self.resource_cls, 'validate', None)
+        self._validate: Optional[Callable] = (
+            validate if callable(validate) else None
+        )
 
     @property
     def conditional(self) -> bool:
@@ -351,9 +402,8 @@ class Resource:
                 if value is not _unset:
                     kw[fld.name] = value
             obj = self.resource_cls(**kw)
-            validate = getattr(obj, 'validate', None)
-            if validate:
-                validate()
+            if self._validate is not None:
+                self._validate(obj)
             return obj
 
     @contextmanager
@@ -382,15 +432,17 @@ class Resource:
             return None
         inner_type = fld.inner_type()
 
-        _rconfig = getattr(inner_type, '_resource_config', None)
+        _rconfig = fld._inner_rconfig
         if _rconfig:
             return _rconfig.object_from_simplified(value)
-        _fs = getattr(inner_type, 'from_simplified', None)
+        _fs = fld._inner_from_simplified
         if _fs:
             return _fs(value)
 
         if fld.takes(list):
             subtype = fld.list_element_type()
+            if fld._scalar_list:
+                return [subtype(v) for v in value]
             return [
                 self._object_sub_from_simplified(subtype, v) for v in value
             ]
@@ -398,11 +450,22 @@ class Resource:
             ktype, vtype = fld.dict_element_types()
             # keys must be simple types right now so we just
             # cast it directly
+            if fld._scalar_dict:
+                return {ktype(k): vtype(v) for k, v in value.items()}
             return {
                 ktype(k): self._object_sub_from_simplified(vtype, v)
                 for k, v in value.items()
             }
 
+        if fld.is_enum:
+            try:
+                # the fast path used by Enum.__new__, minus the metaclass
+                # call machinery
+                return inner_type._value2member_map_[value]
+            except (KeyError, TypeError):
+                # fall through for non-hashable or invalid values so the
+                # enum type raises its usual ValueError
+                pass
         return inner_type(value)
 
     @_xt
@@ -442,11 +505,11 @@ class Resource:
         ):
             return
 
-        _rconfig = getattr(fld.inner_type(), '_resource_config', None)
+        _rconfig = fld._inner_rconfig
         if _rconfig:
             data[fld.name] = _rconfig.object_to_simplified(value)
             return
-        _ts = getattr(fld.inner_type(), 'to_simplified', None)
+        _ts = fld._inner_to_simplified
         if _ts:
             data[fld.name] = _ts(value)
             return
@@ -662,17 +725,33 @@ def load(data: Simplified) -> List[Any]:
      * a dict containing the key "resources" that maps to a list containing dicts
        like the 1st item
     """
-    # Given a bare list/iterator. Assume it contains loadable objects.
-    if not isinstance(data, dict):
-        assert not isinstance(data, (str, bytes))
-        return list(chain.from_iterable(load(v) for v in data))
-    # Given a "list object"
-    if _RESOURCE_TYPE not in data and _RESOURCES in data:
-        rl = data[_RESOURCES]
-        if not isinstance(rl, list):
-            raise TypeError('expected resources list')
-        return list(chain.from_iterable(load(v) for v in rl))
-    # anything else must be a "self describing" object with a resource_type
-    # value
-    resource = _REGISTRY.select(data)
-    return [resource.object_from_simplified(data)]
+    # fast path: a single self-describing object needs no stack walk
+    if isinstance(data, dict) and _RESOURCE_TYPE in data:
+        return [_REGISTRY.select(data).object_from_simplified(data)]
+    # walk the input with an explicit stack rather than recursing so that
+    # long or deeply nested inputs do not consume python stack frames
+    result: List[Any] = []
+    pending: List[Any] = [data]
+    # bind the loop invariants once - these are re-resolved on every
+    # iteration otherwise
+    _select = _REGISTRY.select
+    _append = result.append
+    while pending:
+        current = pending.pop()
+        # Given a bare list/iterator. Assume it contains loadable objects.
+        if not isinstance(current, dict):
+            assert not isinstance(current, (str, bytes))
+            pending.extend(reversed(list(current)))
+            continue
+        # Given a "list object"
+        if _RESOURCE_TYPE not in current and _RESOURCES in current:
+            rl = current[_RESOURCES]
+            if not isinstance(rl, list):
+                raise TypeError('expected resources list')
+            pending.extend(reversed(rl))
+            continue
+        # anything else must be a "self describing" object with a
+        # resource_type value
+        resource = _select(current)
+        _append(resource.object_from_simplified(current))
+    return result
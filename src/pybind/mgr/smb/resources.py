@@ -167,15 +167,17 @@ class CephFSStorage(_RBase):
         # Allow a shortcut form of <subvolgroup>/<subvol> in the subvolume
         # field. If that's the case split it here and put the values in
         # their proper locations.
-        if '/' in self.subvolume and not self.subvolumegroup:
-            try:
-                svg, sv = self.subvolume.split('/')
-                self.subvolumegroup = svg
-                self.subvolume = sv
-            except ValueError:
-                raise ValueError(
-                    'invalid subvolume value: {self.subvolume!r}'
-                )
+        if not self.subvolumegroup:
+            # partition splits on the first separator in a single scan;
+            # any separator left in the remainder makes the value invalid
+            group, slash, subvol = self.subvolume.partition('/')
+            if slash:
+                if '/' in subvol:
+                    raise ValueError(
+                        f'invalid subvolume value: {self.subvolume!r}'
+                    )
+                self.subvolumegroup = group
+                self.subvolume = subvol
         # remove extra slashes, relative path components, etc.
         self.path = validation.normalize_path(self.path)
 
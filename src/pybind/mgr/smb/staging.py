@@ -18,7 +18,6 @@ from ceph.fs.earmarking import EarmarkTopScope
 from . import config_store, resources
 from .enums import (
     AuthMode,
-    ConfigNS,
     Intent,
     JoinSourceType,
     SMBClustering,
@@ -58,11 +57,13 @@ class Staging:
         self.destination_store = store
         self.incoming: Dict[EntryKey, SMBResource] = {}
         self.deleted: Dict[EntryKey, SMBResource] = {}
-        self._store_keycache: Set[EntryKey] = set()
-        self._virt_keycache: Set[EntryKey] = set()
+        self._store_keycache: Optional[Set[EntryKey]] = None
+        self._virt_keycache: Optional[Set[EntryKey]] = None
+        self._contents_cache: Dict[str, Set[str]] = {}
 
     def stage(self, resource: SMBResource) -> None:
-        self._virt_keycache = set()
+        self._virt_keycache = None
+        self._contents_cache = {}
         ekey = resource_key(resource)
         if resource.intent == Intent.REMOVED:
             self.deleted[ekey] = resource
@@ -71,15 +72,16 @@ class Staging:
             self.incoming[ekey] = resource
 
     def _virtual_keys(self) -> Collection[EntryKey]:
-        if self._virt_keycache:
-            return self._virt_keycache
-        self._virt_keycache = set(self._store_keys()) - set(
-            self.deleted
-        ) | set(self.incoming)
+        # an empty cache is still a valid cache - only recompute when the
+        # cache has been invalidated (set to None)
+        if self._virt_keycache is None:
+            self._virt_keycache = set(self._store_keys()) - set(
+                self.deleted
+            ) | set(self.incoming)
         return self._virt_keycache
 
     def _store_keys(self) -> Collection[EntryKey]:
-        if not self._store_keycache:
+        if self._store_keycache is None:
             self._store_keycache = set(self.destination_store)
         return self._store_keycache
 
@@ -90,14 +92,20 @@ class Staging:
         return {k[0] for k in self}
 
     def contents(self, ns: str) -> Collection[str]:
-        return {kname for kns, kname in self if kns == ns}
+        # every cross-check pass lists the same namespaces; avoid
+        # re-filtering the whole virtual key set for each resource checked
+        cached = self._contents_cache.get(ns)
+        if cached is None:
+            cached = {kname for kns, kname in self if kns == ns}
+            self._contents_cache[ns] = cached
+        return cached
 
     def is_new(self, resource: SMBResource) -> bool:
         ekey = resource_key(resource)
         return ekey not in self._store_keys()
 
     def get_cluster(self, cluster_id: str) -> resources.Cluster:
-        ekey = (str(ClusterEntry.namespace), cluster_id)
+        ekey = (ClusterEntry.namespace_str, cluster_id)
         if ekey in self.incoming:
             res = self.incoming[ekey]
             assert isinstance(res, resources.Cluster)
@@ -107,7 +115,7 @@ class Staging:
         ).get_cluster()
 
     def get_join_auth(self, auth_id: str) -> resources.JoinAuth:
-        ekey = (str(JoinAuthEntry.namespace), auth_id)
+        ekey = (JoinAuthEntry.namespace_str, auth_id)
         if ekey in self.incoming:
             res = self.incoming[ekey]
             assert isinstance(res, resources.JoinAuth)
@@ -117,7 +125,7 @@ class Staging:
         ).get_join_auth()
 
     def get_users_and_groups(self, ug_id: str) -> resources.UsersAndGroups:
-        ekey = (str(UsersAndGroupsEntry.namespace), ug_id)
+        ekey = (UsersAndGroupsEntry.namespace_str, ug_id)
         if ekey in self.incoming:
             res = self.incoming[ekey]
             assert isinstance(res, resources.UsersAndGroups)
@@ -408,7 +416,7 @@ def _share_name_in_use(
     shares are using the name.
     """
     share_ids = (share.cluster_id, share.share_id)
-    share_ns = str(ConfigNS.SHARES)
+    share_ns = ShareEntry.namespace_str
     # look for any duplicate names in the staging area.
     # these items are already in memory
     for ekey, res in staging.incoming.items():
@@ -25,6 +25,13 @@ class ReadMe:
     waver: Optional[Tuple[int, str]] = None
 
 
+@pytest.fixture(scope='module')
+def readme_resource():
+    # the resource metadata is immutable in these tests; build it once
+    # for the whole module instead of once per parametrized case
+    return smb.resourcelib.Resource.create(ReadMe)
+
+
 def test_resource_config_field_metadata():
     rmc = smb.resourcelib.Resource.create(ReadMe)
     assert not rmc.conditional
@@ -106,10 +113,9 @@ def test_resource_config_field_metadata():
         },
     ],
 )
-def test_basic_resource_config_to_simplified(params):
-    rmc = smb.resourcelib.Resource.create(ReadMe)
+def test_basic_resource_config_to_simplified(params, readme_resource):
     obj = ReadMe(*params.get('args', []), **params.get('kwargs', {}))
-    result = rmc.object_to_simplified(obj)
+    result = readme_resource.object_to_simplified(obj)
     assert result == params['expected']
 
 
@@ -162,10 +168,9 @@ def test_basic_resource_config_to_simplified(params):
         },
     ],
 )
-def test_basic_resource_config_from_simplified(params):
+def test_basic_resource_config_from_simplified(params, readme_resource):
     data = params['data']
-    rmc = smb.resourcelib.Resource.create(ReadMe)
-    result = rmc.object_from_simplified(data)
+    result = readme_resource.object_from_simplified(data)
     assert result == params['expected']
 
 
@@ -328,74 +333,48 @@ def test_resource_round_trip2():
     assert r1 == r2
 
 
+# shared input payloads for the load tests below. load() does not modify
+# its input, so the parametrize cases can reference these directly
+# instead of repeating the literals
+SMALLBIZ_DATA = {
+    'resource_type': 'smallbiz',
+    'name': 'Le Shoppe',
+    'address': ['12 Fashion Way', 'Urbia', 'WA', '01209'],
+    'people': [
+        {'name': 'Madelyn', 'age': 39},
+        {'name': 'Mark', 'age': 39},
+    ],
+}
+
+BIGBIZ_DATA = {
+    'resource_type': 'bigbiz',
+    'name': 'MegaLoMart',
+    'address': ['1 MegaLo Drive', 'Mango', 'TX', '22020'],
+    'ceo': {'name': 'D. B. Bawes', 'age': 61},
+}
+
+
 @pytest.mark.parametrize(
     "params",
     [
         # small biz 1
         {
-            'data': {
-                'resource_type': 'smallbiz',
-                'name': 'Le Shoppe',
-                'address': ['12 Fashion Way', 'Urbia', 'WA', '01209'],
-                'people': [
-                    {'name': 'Madelyn', 'age': 39},
-                    {'name': 'Mark', 'age': 39},
-                ],
-            },
+            'data': SMALLBIZ_DATA,
             'expect_types': [SmallBiz],
         },
         # big biz 1
         {
-            'data': {
-                'resource_type': 'bigbiz',
-                'name': 'MegaLoMart',
-                'address': ['1 MegaLo Drive', 'Mango', 'TX', '22020'],
-                'ceo': {'name': 'D. B. Bawes', 'age': 61},
-            },
+            'data': BIGBIZ_DATA,
             'expect_types': [BigBiz],
         },
         # raw list
         {
-            'data': [
-                {
-                    'resource_type': 'smallbiz',
-                    'name': 'Le Shoppe',
-                    'address': ['12 Fashion Way', 'Urbia', 'WA', '01209'],
-                    'people': [
-                        {'name': 'Madelyn', 'age': 39},
-                        {'name': 'Mark', 'age': 39},
-                    ],
-                },
-                {
-                    'resource_type': 'bigbiz',
-                    'name': 'MegaLoMart',
-                    'address': ['1 MegaLo Drive', 'Mango', 'TX', '22020'],
-                    'ceo': {'name': 'D. B. Bawes', 'age': 61},
-                },
-            ],
+            'data': [SMALLBIZ_DATA, BIGBIZ_DATA],
             'expect_types': [SmallBiz, BigBiz],
         },
         # list object
         {
-            'data': {
-                'resources': [
-                    {
-                        'resource_type': 'smallbiz',
-                        'name': 'Le Shoppe',
-                        'address': ['12 Fashion Way', 'Urbia', 'WA', '01209'],
-                        'people': [
-                            {'name': 'Madelyn', 'age': 39},
-                            {'name': 'Mark', 'age': 39},
-                        ],
-                    },
-                    {
-                        'resource_type': 'bigbiz',
-                        'name': 'MegaLoMart',
-                        'address': ['1 MegaLo Drive', 'Mango', 'TX', '22020'],
-                        'ceo': {'name': 'D. B. Bawes', 'age': 61},
-                    },
-                ]
-            },
+            'data': {'resources': [SMALLBIZ_DATA, BIGBIZ_DATA]},
             'expect_types': [SmallBiz, BigBiz],
         },
     ],
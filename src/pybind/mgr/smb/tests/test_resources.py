@@ -1,9 +1,20 @@
 import pytest
+import yaml
 
 import smb.resourcelib
 import smb.resources
 from smb import enums
 
+try:
+    # libyaml-backed loader: much faster parsing for the fixture documents
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml not always built
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+
+def _load_yaml_docs(txt):
+    return yaml.load_all(txt, Loader=_YamlLoader)
+
 
 @pytest.mark.parametrize(
     "params",
@@ -152,10 +163,13 @@ intent: removed
 """
 
 
-def test_load_yaml_resource_yaml1():
-    import yaml
+# parse the constant fixtures once at import; the tests only need the
+# materialized document lists
+YAML1_DOCS = list(_load_yaml_docs(YAML1))
+
 
-    loaded = smb.resourcelib.load(yaml.safe_load_all(YAML1))
+def test_load_yaml_resource_yaml1():
+    loaded = smb.resourcelib.load(YAML1_DOCS)
     assert len(loaded) == 6
 
     assert isinstance(loaded[0], smb.resources.Cluster)
@@ -234,10 +248,11 @@ values:
 """
 
 
-def test_load_yaml_resource_yaml2():
-    import yaml
+YAML2_DOCS = list(_load_yaml_docs(YAML2))
+
 
-    loaded = smb.resourcelib.load(yaml.safe_load_all(YAML2))
+def test_load_yaml_resource_yaml2():
+    loaded = smb.resourcelib.load(YAML2_DOCS)
     assert len(loaded) == 5
 
     assert isinstance(loaded[0], smb.resources.Cluster)
@@ -608,16 +623,12 @@ auth_id: ""
     ],
 )
 def test_load_error(params):
-    import yaml
-
-    data = yaml.safe_load_all(params['yaml'])
+    data = _load_yaml_docs(params['yaml'])
     with pytest.raises(params['exc_type'], match=params['error']):
         smb.resourcelib.load(data)
 
 
 def test_cluster_placement_1():
-    import yaml
-
     yaml_str = """
 resource_type: ceph.smb.cluster
 cluster_id: rhumba
@@ -633,7 +644,7 @@ placement:
     - cephnode2
     - cephnode4
 """
-    data = yaml.safe_load_all(yaml_str)
+    data = _load_yaml_docs(yaml_str)
     loaded = smb.resources.load(data)
     assert loaded
     cluster = loaded[0]
@@ -649,8 +660,6 @@ placement:
 
 
 def test_cluster_placement_2():
-    import yaml
-
     yaml_str = """
 resource_type: ceph.smb.cluster
 cluster_id: rhumba
@@ -664,7 +673,7 @@ placement:
   count: 3
   label: ilovesmb
 """
-    data = yaml.safe_load_all(yaml_str)
+    data = _load_yaml_docs(yaml_str)
     loaded = smb.resources.load(data)
     assert loaded
     cluster = loaded[0]
@@ -680,8 +689,6 @@ placement:
 
 
 def test_share_with_login_control_1():
-    import yaml
-
     yaml_str = """
 resource_type: ceph.smb.share
 cluster_id: rhumba
@@ -695,7 +702,7 @@ login_control:
   - name: bob
     access: read
 """
-    data = yaml.safe_load_all(yaml_str)
+    data = _load_yaml_docs(yaml_str)
     loaded = smb.resources.load(data)
     assert loaded
     share = loaded[0]
@@ -707,8 +714,6 @@ login_control:
 
 
 def test_share_with_login_control_2():
-    import yaml
-
     yaml_str = """
 resource_type: ceph.smb.share
 cluster_id: rhumba
@@ -730,7 +735,7 @@ login_control:
   - name: delbard
     access: none
 """
-    data = yaml.safe_load_all(yaml_str)
+    data = _load_yaml_docs(yaml_str)
     loaded = smb.resources.load(data)
     assert loaded
     share = loaded[0]
@@ -751,8 +756,6 @@ login_control:
 
 
 def test_tls_credential():
-    import yaml
-
     yaml_str = """
 resource_type: ceph.smb.tls.credential
 tls_credential_id: tc1
@@ -794,7 +797,7 @@ value: |
   KNDwOknnnEhdXshW5M8G8ZhkahG8YABHTBw=
   -----END CERTIFICATE-----
 """
-    data = yaml.safe_load_all(yaml_str)
+    data = _load_yaml_docs(yaml_str)
     loaded = smb.resources.load(data)
     assert loaded
     tcred = loaded[0]
@@ -895,8 +898,6 @@ def test_load_text(params):
 
 @pytest.mark.parametrize("max_conn", [0, 25])
 def test_share_with_comment_and_max_connections(max_conn):
-    import yaml
-
     yaml_str = f"""
 resource_type: ceph.smb.share
 cluster_id: rhumba
@@ -909,7 +910,7 @@ comment: This is a test share
 max_connections: {max_conn}
 """
 
-    data = yaml.safe_load_all(yaml_str)
+    data = _load_yaml_docs(yaml_str)
     loaded = smb.resources.load(data)
     assert loaded
 
@@ -919,8 +920,6 @@ max_connections: {max_conn}
 
 
 def test_share_with_invalid_max_connections():
-    import yaml
-
     yaml_str = """
 resource_type: ceph.smb.share
 cluster_id: rhumba
@@ -931,7 +930,7 @@ cephfs:
     path: /bad
 max_connections: -10
 """
-    data = yaml.safe_load_all(yaml_str)
+    data = _load_yaml_docs(yaml_str)
     with pytest.raises(
         ValueError,
         match="max_connections must be 0 or a non-negative integer",
@@ -940,8 +939,6 @@ max_connections: -10
 
 
 def test_share_with_invalid_comment():
-    import yaml
-
     yaml_str = """
 resource_type: ceph.smb.share
 cluster_id: rhumba
@@ -952,14 +949,12 @@ cephfs:
     path: /weird
 comment: "Invalid\\nComment"
 """
-    data = yaml.safe_load_all(yaml_str)
+    data = _load_yaml_docs(yaml_str)
     with pytest.raises(ValueError, match="Comment cannot contain newlines"):
         smb.resources.load(data)
 
 
 def test_share_with_qos():
-    import yaml
-
     yaml_str = """
 resource_type: ceph.smb.share
 cluster_id: qoscluster
@@ -976,7 +971,7 @@ cephfs:
         read_delay_max: 20
         write_delay_max: 30
 """
-    data = yaml.safe_load_all(yaml_str)
+    data = _load_yaml_docs(yaml_str)
     loaded = smb.resources.load(data)
     assert loaded
 
@@ -33,9 +33,12 @@ def checked(v: Optional[T]) -> T:
     return v
 
 
+_YN = ('No', 'Yes')
+
+
 def ynbool(value: bool) -> str:
     """Convert a bool to an smb.conf-style boolean string."""
-    return 'Yes' if value else 'No'
+    return _YN[bool(value)]
 
 
 def rand_name(prefix: str, max_len: int = 18, suffix_len: int = 8) -> str:
@@ -303,18 +303,22 @@ def _git_command(ctx, args):
 @ftcache
 def _git_current_branch(ctx):
     cmd = _git_command(ctx, ["rev-parse", "--abbrev-ref", "HEAD"])
-    res = _run(cmd, check=True, capture_output=True)
-    return res.stdout.decode("utf8").strip()
+    res = _run(cmd, check=True, capture_output=True, text=True)
+    return res.stdout.strip()
 
 
+# As above, assume HEAD stays put while the script runs so repeat
+# lookups (find-srpm runs more than once when building rpms) don't
+# fork another git.
+@ftcache
 def _git_current_sha(ctx, short=True):
     args = ["rev-parse"]
     if short:
         args.append("--short")
     args.append("HEAD")
     cmd = _git_command(ctx, args)
-    res = _run(cmd, check=True, capture_output=True)
-    return res.stdout.decode("utf8").strip()
+    res = _run(cmd, check=True, capture_output=True, text=True)
+    return res.stdout.strip()
 
 
 def _sanitize_for_oci_tag(branch_name):
@@ -748,8 +752,15 @@ def build_container(ctx):
     if ctx.cli.build_args:
         cmd.extend([f"--build-arg={v}" for v in ctx.cli.build_args])
     cmd += ["-f", ctx.cli.containerfile, ctx.cli.containerdir]
+    run_kwargs = {}
+    if "docker" in ctx.container_engine:
+        # classic docker build re-runs every instruction; BuildKit layer
+        # caching makes repeat builds short-circuit at the first changed
+        # instruction (podman already caches layers by default). Harmless
+        # on docker versions where BuildKit is already the default.
+        run_kwargs["env"] = dict(os.environ, DOCKER_BUILDKIT="1")
     with ctx.user_command():
-        _run(cmd, check=True, ctx=ctx)
+        _run(cmd, check=True, ctx=ctx, **run_kwargs)
 
 
 def _check_cached_image(ctx):
@@ -948,11 +959,11 @@ def _find_srpm_by_rpm_query(ctx):
             f"cd {ctx.cli.homedir} && {rpmquery_cmd}",
         ],
     )
-    res = _run(cmd, check=False, capture_output=True)
+    res = _run(cmd, check=False, capture_output=True, text=True)
     if res.returncode != 0:
         log.warning("Failed to list rpm versions")
         return None
-    versions = set(l.strip() for l in res.stdout.decode().splitlines())
+    versions = set(l.strip() for l in res.stdout.splitlines())
     if len(versions) > 1:
         raise RuntimeError("too many versions in rpm query")
     version = list(versions)[0]